@@ -6,7 +6,8 @@ import faiss
 import numpy as np
 from bs4 import BeautifulSoup
 from datetime import datetime
-from sentence_transformers import SentenceTransformer
+
+from scripts.embedding_runtime import get_embedder
 
 # =====================================================
 # ------------------ SETTINGS -------------------------
@@ -27,12 +28,6 @@ VECTOR_DIR = "vectorstore"
 VECTOR_PATH = f"{VECTOR_DIR}/index.faiss"
 METADATA_PATH = f"{VECTOR_DIR}/metadata.json"
 
-# Load embedding model
-model = SentenceTransformer("all-MiniLM-L6-v2")
-EMB_DIM = model.get_sentence_embedding_dimension()
-
-print("Model loaded ✔", "Embedding dim:", EMB_DIM)
-
 # =====================================================
 # ------------------ HELPERS ---------------------------
 # =====================================================
@@ -137,10 +132,11 @@ def run_scraper():
 
     if index is None:
         print("Creating new FAISS index")
-        index = faiss.IndexFlatL2(EMB_DIM)
+        index = faiss.IndexFlatL2(get_embedder().dimension)
         metadata = []
 
     added_count = 0
+    topic_emb = None
 
     for entry in feed.entries:
         url = entry.link
@@ -160,8 +156,9 @@ def run_scraper():
             continue
 
         # Embeddings
-        topic_emb = model.encode([TOPIC], convert_to_numpy=True)
-        art_emb = model.encode([content], convert_to_numpy=True)
+        if topic_emb is None:
+            topic_emb = get_embedder().encode([TOPIC])
+        art_emb = get_embedder().encode([content])
 
         # Similarity
         sim = float(np.dot(topic_emb, art_emb.T)[0][0])
@@ -205,4 +202,5 @@ def run_scraper():
 # ------------------ RUN SCRIPT ------------------------
 # =====================================================
 
-run_scraper()
\ No newline at end of file
+if __name__ == "__main__":
+    run_scraper()
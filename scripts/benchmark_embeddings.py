@@ -0,0 +1,112 @@
+"""
+Compare the shared embedding runtime against the original setup
+(a plain SentenceTransformer built at import time).
+
+Reports cold start (fresh interpreter: imports + model load + first vector),
+embeddings/second on article sentences, and how close the vectors are.
+
+    python scripts/benchmark_embeddings.py --backends torch onnx
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import subprocess
+import numpy as np
+
+from embedding_runtime import MODEL_NAME, load_embedder
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ARTICLES_FILE = os.path.join(SCRIPTS_DIR, os.pardir, "articles.json")
+
+BASELINE_COLD_START = f"""
+from sentence_transformers import SentenceTransformer
+SentenceTransformer("{MODEL_NAME}").encode("warmup")
+"""
+
+RUNTIME_COLD_START = """
+from embedding_runtime import get_embedder
+get_embedder().encode("warmup")
+"""
+
+
+# ===================== HELPERS =====================
+def load_sentences(limit):
+    with open(ARTICLES_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    articles = data.values() if isinstance(data, dict) else data
+
+    sentences = []
+    for a in articles:
+        for s in re.split(r"(?<=[.!?]) +", a.get("content", "")):
+            if len(s) >= 40:
+                sentences.append(s)
+                if len(sentences) >= limit:
+                    return sentences
+    return sentences
+
+
+def cold_start(code, env=None, runs=3):
+    """Best wall time of a fresh interpreter running `code`."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=SCRIPTS_DIR,
+            env={**os.environ, **(env or {})},
+            check=True,
+            capture_output=True,
+        )
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def throughput(encode, texts, runs=3):
+    encode(texts[:8])
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        vectors = encode(texts)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(texts) / best, vectors
+
+
+# ===================== MAIN =====================
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx"])
+    parser.add_argument("--texts", type=int, default=512)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = load_sentences(args.texts)
+    print(f"📄 {len(texts)} sentences from {os.path.normpath(ARTICLES_FILE)}")
+
+    from sentence_transformers import SentenceTransformer
+
+    baseline = SentenceTransformer(MODEL_NAME)
+    rows = []
+
+    cold = cold_start(BASELINE_COLD_START, runs=args.runs)
+    rate, reference = throughput(lambda t: baseline.encode(t, convert_to_numpy=True), texts, args.runs)
+    rows.append(("baseline", cold, rate, 1.0, 0.0))
+
+    for backend in args.backends:
+        cold = cold_start(RUNTIME_COLD_START, {"EMBEDDING_BACKEND": backend}, args.runs)
+        embedder = load_embedder(backend)
+        rate, vectors = throughput(embedder.encode, texts, args.runs)
+        cosine = np.sum(vectors * reference, axis=1)
+        rows.append((backend, cold, rate, float(cosine.min()), float(np.abs(vectors - reference).max())))
+
+    print(f"\n{'setup':<10}{'cold start (s)':>16}{'emb/s':>10}{'min cos':>10}{'max |diff|':>12}")
+    for name, cold, rate, cos, diff in rows:
+        print(f"{name:<10}{cold:>16.2f}{rate:>10.1f}{cos:>10.4f}{diff:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
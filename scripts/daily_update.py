@@ -4,17 +4,19 @@ import re
 import json
 import uuid
 import feedparser
+import numpy as np
 import requests
 from bs4 import BeautifulSoup
 from readability.readability import Document as ReadabilityDocument
 from datetime import datetime, timezone
 from dateutil import parser as dateparser
 
-from sentence_transformers import SentenceTransformer, util
 from qdrant_client import QdrantClient
 from qdrant_client.models import PointStruct
 from qdrant_client import QdrantClient
 from qdrant_client.models import VectorParams, Distance, PointStruct
+
+from embedding_runtime import get_embedder
 # ===================== Connect Qdrant Client =====================
 
 qdrant = QdrantClient(
@@ -57,9 +59,6 @@ RSS_FEEDS = [
 ]
 
 
-# ===================== MODELS =====================
-embedding_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-VECTOR_SIZE = embedding_model.get_sentence_embedding_dimension()
 # ===================== UTILS =====================
 def clean_text(text):
     """
@@ -112,13 +111,14 @@ def semantic_chunk(text, similarity_threshold=0.65, max_len=1500):
     if len(sentences) < 2:
         return []
 
-    embeddings = embedding_model.encode(sentences, convert_to_tensor=True)
+    # Normalized vectors: dot product of neighbours is their cosine similarity
+    embeddings = get_embedder().encode(sentences)
 
     chunks = []
     current = [sentences[0]]
 
     for i in range(1, len(sentences)):
-        sim = util.cos_sim(embeddings[i], embeddings[i - 1]).item()
+        sim = float(np.dot(embeddings[i], embeddings[i - 1]))
         if sim < similarity_threshold or sum(len(s) for s in current) > max_len:
             chunks.append(" ".join(current))
             current = [sentences[i]]
@@ -187,13 +187,16 @@ def upsert_to_qdrant(articles):
 
         print(f"📄 '{article['title']}' → {len(chunks)} chunks")
 
-        for idx, chunk in enumerate(chunks):
-            vector = embedding_model.encode(chunk).tolist()
+        if not chunks:
+            continue
+
+        vectors = get_embedder().encode(chunks)
 
+        for idx, (chunk, vector) in enumerate(zip(chunks, vectors)):
             points.append(
                 PointStruct(
                     id=str(uuid.uuid4()),
-                    vector=vector,
+                    vector=vector.tolist(),
                     payload={
                         "title": article["title"],
                         "url": article["url"],
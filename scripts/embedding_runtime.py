@@ -0,0 +1,200 @@
+import os
+import threading
+import numpy as np
+
+# ===================== CONFIG =====================
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+MAX_SEQ_LENGTH = 256
+
+# "torch" (sentence-transformers, default) or "onnx" (onnxruntime, no PyTorch import)
+BACKEND = os.environ.get("EMBEDDING_BACKEND", "torch").lower()
+# Directory produced by export_onnx(); when unset the ONNX file is pulled from the model repo
+ONNX_PATH = os.environ.get("EMBEDDING_ONNX_PATH")
+ONNX_FILE = os.environ.get("EMBEDDING_ONNX_FILE", "onnx/model_quint8_avx2.onnx")
+
+NUM_THREADS = int(os.environ.get("EMBEDDING_THREADS", min(4, os.cpu_count() or 1)))
+BATCH_SIZE = int(os.environ.get("EMBEDDING_BATCH_SIZE", 32))
+MAX_BATCH_TOKENS = int(os.environ.get("EMBEDDING_MAX_BATCH_TOKENS", 8192))
+
+_embedder = None
+_langchain_embeddings = None
+_lock = threading.Lock()
+
+
+# ===================== BACKENDS =====================
+class TorchEmbedder:
+    """sentence-transformers model, same vectors as the original scripts."""
+
+    backend = "torch"
+
+    def __init__(self, model_name=MODEL_NAME, num_threads=NUM_THREADS, batch_size=BATCH_SIZE):
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        torch.set_num_threads(num_threads)
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.batch_size = batch_size
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts, batch_size=None):
+        single = isinstance(texts, str)
+        vectors = self.model.encode(
+            [texts] if single else list(texts),
+            batch_size=batch_size or self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        ).astype(np.float32)
+        return vectors[0] if single else vectors
+
+
+class OnnxEmbedder:
+    """onnxruntime + tokenizers, mean pooling and L2 norm done in numpy."""
+
+    backend = "onnx"
+
+    def __init__(self, model_name=MODEL_NAME, onnx_path=ONNX_PATH, onnx_file=ONNX_FILE,
+                 num_threads=NUM_THREADS, batch_size=BATCH_SIZE, max_batch_tokens=MAX_BATCH_TOKENS):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        if onnx_path:
+            model_file = os.path.join(onnx_path, onnx_file)
+            tokenizer_file = os.path.join(onnx_path, "tokenizer.json")
+        else:
+            from huggingface_hub import hf_hub_download
+
+            model_file = hf_hub_download(model_name, onnx_file)
+            tokenizer_file = hf_hub_download(model_name, "tokenizer.json")
+
+        self.tokenizer = Tokenizer.from_file(tokenizer_file)
+        self.tokenizer.enable_truncation(max_length=MAX_SEQ_LENGTH)
+        self.tokenizer.no_padding()
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = num_threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(model_file, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.dimension = self.session.get_outputs()[0].shape[-1]
+
+    def _batches(self, encodings, batch_size):
+        """Length-sorted batches capped by size and by padded token count."""
+        order = sorted(range(len(encodings)), key=lambda i: len(encodings[i].ids))
+        batch = []
+        for i in order:
+            longest = len(encodings[i].ids)
+            if batch and (len(batch) >= batch_size or longest * (len(batch) + 1) > self.max_batch_tokens):
+                yield batch
+                batch = []
+            batch.append(i)
+        if batch:
+            yield batch
+
+    def _run(self, encodings):
+        width = max(len(e.ids) for e in encodings)
+        input_ids = np.zeros((len(encodings), width), dtype=np.int64)
+        attention_mask = np.zeros_like(input_ids)
+        for row, e in enumerate(encodings):
+            input_ids[row, :len(e.ids)] = e.ids
+            attention_mask[row, :len(e.ids)] = 1
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+
+        token_embeddings = self.session.run(None, feeds)[0]
+        mask = attention_mask[..., None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        return pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+
+    def encode(self, texts, batch_size=None):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+
+        if texts:
+            encodings = self.tokenizer.encode_batch(texts)
+            for batch in self._batches(encodings, batch_size or self.batch_size):
+                vectors[batch] = self._run([encodings[i] for i in batch])
+
+        return vectors[0] if single else vectors
+
+
+BACKENDS = {"torch": TorchEmbedder, "onnx": OnnxEmbedder}
+
+
+# ===================== SHARED RUNTIME =====================
+def load_embedder(backend=None, **kwargs):
+    """Build a new embedder; most callers want get_embedder() instead."""
+    backend = (backend or BACKEND).lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown embedding backend '{backend}' (expected one of {sorted(BACKENDS)})")
+    return BACKENDS[backend](**kwargs)
+
+
+def get_embedder():
+    """Process-wide embedder, loaded on first use."""
+    global _embedder
+    if _embedder is None:
+        with _lock:
+            if _embedder is None:
+                _embedder = load_embedder()
+                print(f"✔ Embedding model loaded ({_embedder.backend}, dim {_embedder.dimension})")
+    return _embedder
+
+
+def get_langchain_embeddings():
+    """LangChain Embeddings wrapper around the shared embedder (for FAISS etc.)."""
+    global _langchain_embeddings
+    if _langchain_embeddings is None:
+        from langchain_core.embeddings import Embeddings
+
+        class SharedEmbeddings(Embeddings):
+            def embed_documents(self, texts):
+                return get_embedder().encode(texts).tolist()
+
+            def embed_query(self, text):
+                return get_embedder().encode(text).tolist()
+
+        _langchain_embeddings = SharedEmbeddings()
+    return _langchain_embeddings
+
+
+# ===================== ONNX EXPORT =====================
+def export_onnx(output_dir, quantization="avx2", model_name=MODEL_NAME):
+    """
+    Export the model to ONNX plus a dynamically quantized int8 copy
+    (needs optimum[onnxruntime]). Returns the quantized file relative to
+    output_dir, i.e. the EMBEDDING_ONNX_FILE to use with EMBEDDING_ONNX_PATH=output_dir.
+    """
+    import glob
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    model = SentenceTransformer(model_name, backend="onnx", device="cpu")
+    model.save_pretrained(output_dir)
+    export_dynamic_quantized_onnx_model(model, quantization, output_dir)
+
+    # Saved as onnx/model_<weights dtype>_<config>.onnx, e.g. model_quint8_avx2.onnx
+    matches = glob.glob(os.path.join(output_dir, "onnx", f"model_*int8_{quantization}.onnx"))
+    if len(matches) != 1:
+        raise FileNotFoundError(f"Expected one quantized '{quantization}' model in {output_dir}/onnx, found {matches}")
+    onnx_file = os.path.relpath(matches[0], output_dir).replace(os.sep, "/")
+
+    print(f"✔ ONNX model exported to {output_dir}")
+    print(f"  EMBEDDING_BACKEND=onnx EMBEDDING_ONNX_PATH={output_dir} EMBEDDING_ONNX_FILE={onnx_file}")
+    return onnx_file
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export the embedding model to ONNX/int8")
+    parser.add_argument("output_dir")
+    parser.add_argument("--quantization", default="avx2", help="avx2, avx512, avx512_vnni or arm64")
+    args = parser.parse_args()
+
+    export_onnx(args.output_dir, args.quantization)
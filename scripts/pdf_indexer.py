@@ -6,15 +6,14 @@ from langchain_community.docstore.in_memory import InMemoryDocstore # Added for
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.document_loaders import PyPDFDirectoryLoader
 
+from embedding_runtime import get_langchain_embeddings
+
 PDF_FOLDER = "data/pdfs"
 VECTORSTORE_FOLDER = "data/vectorstore/faiss_index"
 MIN_CHUNK_LENGTH = 20
 
-embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
-
 def clean_text(text):
     text = re.sub(r"\s+", " ", text)
     text = re.sub(r"[^\x00-\x7F]+", " ", text)
@@ -37,7 +36,7 @@ def load_and_index_pdfs():
     print(f"✔ Loaded {len(pdf_docs)} PDF chunks")
 
     # Save FAISS index
-    faiss_index = FAISS.from_documents(pdf_docs, embeddings)
+    faiss_index = FAISS.from_documents(pdf_docs, get_langchain_embeddings())
     faiss_index.save_local(VECTORSTORE_FOLDER)
     print(f"✔ FAISS index saved at {VECTORSTORE_FOLDER}")
 